@@ -1174,6 +1174,25 @@ class InferredSignature:
                 sig_info.partial_type_matches[f"({left!s}, {right!s})"] = str(match)
 
 
+def _wrap_var_positional(type_system: TypeSystem, typ: ProperType) -> ProperType:
+    return Instance(type_system.to_type_info(list), (typ,))
+
+
+def _wrap_var_keyword(type_system: TypeSystem, typ: ProperType) -> ProperType:
+    return Instance(
+        type_system.to_type_info(dict), (type_system.convert_type_hint(str), typ)
+    )
+
+
+# Maps the kinds of variadic parameters to the wrapping of their types.
+_VAR_PARAM_WRAPPERS: dict[
+    inspect._ParameterKind, Callable[[TypeSystem, ProperType], ProperType]
+] = {
+    inspect.Parameter.VAR_POSITIONAL: _wrap_var_positional,
+    inspect.Parameter.VAR_KEYWORD: _wrap_var_keyword,
+}
+
+
 class TypeSystem:  # noqa: PLR0904
     """Implements Pynguin's internal type system.
 
@@ -1457,11 +1476,9 @@ class TypeSystem:  # noqa: PLR0904
         Returns:
             The wrapped type, or the original type, if no wrapping is required.
         """
-        if param_kind == inspect.Parameter.VAR_POSITIONAL:
-            return Instance(self.to_type_info(list), (typ,))
-        if param_kind == inspect.Parameter.VAR_KEYWORD:
-            return Instance(self.to_type_info(dict), (self.convert_type_hint(str), typ))
-        return typ
+        if (wrapper := _VAR_PARAM_WRAPPERS.get(param_kind)) is None:
+            return typ
+        return wrapper(self, typ)
 
     def infer_type_info(
         self,
@@ -93,30 +93,21 @@ class AssertionVerificationTrace:
         default_factory=lambda: defaultdict(OrderedSet)
     )
 
-    def merge(self, other: AssertionVerificationTrace) -> None:
-        """Merge another trace into this trace.
-
-        Args:
-            other: The other trace
-
-        """
-        for pos, assertions in other.failed.items():
-            self.failed[pos].update(assertions)
-        for pos, assertions in other.error.items():
-            self.error[pos].update(assertions)
-
-    def was_violated(self, stmt_idx: int, assertion_idx: int) -> bool:
-        """Was the assertion at the given position violated?
-
-        This may happen because the assertion failed or another error occurred.
-
-        Args:
-            stmt_idx: The statement index.
-            assertion_idx: The assertion index.
+    def get_violations(self) -> set[tuple[int, int]]:
+        """Provides the positions of all violated assertions.
 
         Returns:
-            True, if the assertion was violated.
+            A set of (statement index, assertion index) pairs of all assertions that
+            failed or raised an error.
         """
-        if stmt_idx in self.failed and assertion_idx in self.failed[stmt_idx]:
-            return True
-        return bool(stmt_idx in self.error and assertion_idx in self.error[stmt_idx])
+        violations = {
+            (stmt_idx, assertion_idx)
+            for stmt_idx, assertions in self.failed.items()
+            for assertion_idx in assertions
+        }
+        violations.update(
+            (stmt_idx, assertion_idx)
+            for stmt_idx, assertions in self.error.items()
+            for assertion_idx in assertions
+        )
+        return violations
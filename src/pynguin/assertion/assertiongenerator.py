@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import ast
 import dataclasses
+import hashlib
 import logging
 import threading
 import types
@@ -18,7 +19,6 @@ from typing import TYPE_CHECKING
 import mutpy
 
 import pynguin.assertion.assertion as ass
-import pynguin.assertion.assertion_trace as at
 import pynguin.assertion.assertiontraceobserver as ato
 import pynguin.assertion.mutation_analysis.mutationadapter as ma
 import pynguin.configuration as config
@@ -30,6 +30,7 @@ from pynguin.analyses.constants import ConstantPool
 from pynguin.analyses.constants import DynamicConstantProvider
 from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.instrumentation.machinery import build_transformer
+from pynguin.utils import forking
 from pynguin.utils import randomness
 from pynguin.utils.orderedset import OrderedSet
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
@@ -161,6 +162,57 @@ class _MutantInfo:
     killed_by: list[int] = dataclasses.field(default_factory=list)
 
 
+@dataclasses.dataclass
+class _MutantExecution:
+    """The outcome of executing the test cases on a single mutant.
+
+    The analysis only needs a few facts about each execution result, thus we store
+    them column-wise, i.e., each list holds one entry per test case.
+    """
+
+    # Did the execution of the test case time out?
+    timeouts: list[bool] = dataclasses.field(default_factory=list)
+
+    # Did the test case kill the mutant?
+    kills: list[bool] = dataclasses.field(default_factory=list)
+
+    # The violated assertions as (statement position, assertion index) pairs.
+    violations: list[set[tuple[int, int]]] = dataclasses.field(default_factory=list)
+
+    @staticmethod
+    def timed_out(number_of_tests: int) -> _MutantExecution:
+        """Create the outcome of a mutant on which all test cases timed out.
+
+        Args:
+            number_of_tests: The number of test cases.
+
+        Returns:
+            The outcome.
+        """
+        return _MutantExecution(
+            [True] * number_of_tests,
+            [False] * number_of_tests,
+            [set() for _ in range(number_of_tests)],
+        )
+
+    def append(self, result: ex.ExecutionResult) -> None:
+        """Add the result of executing the next test case.
+
+        Args:
+            result: The execution result.
+        """
+        trace = result.assertion_verification_trace
+        self.timeouts.append(result.timeout)
+        self.kills.append(
+            len(trace.error) > 0
+            or len(trace.failed) > 0
+            # Execution with assertions should not raise exceptions.
+            # If it does, it is probably an incompetent mutant
+            or result.has_test_exceptions()
+        )
+        self.violations.append(trace.get_violations())
+
+
 @dataclasses.dataclass
 class _MutationSummary:
     """Summary about mutation."""
@@ -239,7 +291,11 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         self, ast_node, module_name="mutant", module_dict=None
     ):
         # Mimics mutpy.utils.create_module but adds instrumentation to the resulting
-        # module
+        # module.  We only keep a digest of the code to find identical mutants, as
+        # the code of all mutants would take up too much memory.
+        self._mutant_digests.append(
+            hashlib.blake2b(ast.dump(ast_node).encode()).digest()
+        )
         code = compile(ast_node, module_name, "exec")
         if self._testing:
             self._testing_created_mutants.append(ast.unparse(ast_node))
@@ -250,14 +306,27 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         exec(code, module.__dict__)  # noqa: S102
         return module
 
-    def __init__(self, plain_executor: ex.TestCaseExecutor, *, testing: bool = False):
+    def __init__(
+        self,
+        plain_executor: ex.TestCaseExecutor,
+        *,
+        testing: bool = False,
+        jobs: int | None = None,
+    ):
         """Initializes the generator.
 
         Args:
             plain_executor: Executor used for plain execution
             testing: Enable test mode, currently required for integration testing.
+            jobs: The number of worker processes used to execute the tests on the
+                mutants, defaults to the configured number of mutation jobs.
         """
         super().__init__(plain_executor)
+        self._jobs = (
+            jobs
+            if jobs is not None
+            else config.configuration.test_case_output.mutation_jobs
+        )
 
         # We use a separate tracer and executor to execute tests on the mutants.
         self._mutation_tracer = ex.ExecutionTracer()
@@ -265,7 +334,7 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             threading.current_thread().ident
         )
         self._mutation_executor = ex.TestCaseExecutor(self._mutation_tracer)
-        self._mutation_executor.add_observer(ato.AssertionVerificationObserver())
+        self._verification_observer = ato.AssertionVerificationObserver()
 
         self._transformer = build_transformer(
             self._mutation_tracer,
@@ -276,82 +345,175 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         self._testing = testing
         self._testing_created_mutants: list[str] = []
         self._testing_mutation_summary: _MutationSummary = _MutationSummary()
-        adapter = ma.MutationAdapter()
+        adapter = ma.MutationAdapter(jobs=self._jobs)
 
         # Evil hack to change the way mutpy creates mutated modules.
+        self._mutant_digests: list[bytes] = []
         mutpy.utils.create_module = self._create_module_with_instrumentation
         self._mutated_modules = [x for x, _ in adapter.mutate_module()]
+        assert len(self._mutant_digests) == len(self._mutated_modules)
+
+        # Different mutation operators may create identical mutants.  The tests
+        # behave the same on those, thus we only execute them on the first one.
+        # Mutants with equal digests of their code are considered identical.
+        first_mutant: dict[bytes, int] = {}
+        self._mutant_origins = [
+            first_mutant.setdefault(digest, idx)
+            for idx, digest in enumerate(self._mutant_digests)
+        ]
+        self._mutant_digests.clear()
 
     def _add_assertions(self, test_cases: list[tc.TestCase]):
         super()._add_assertions(test_cases)
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]] = [
-            (test, []) for test in test_cases
-        ]
+        executions = self._execute_on_mutants(test_cases)
+        summary = self.__compute_mutation_summary(executions)
+        self.__report_mutation_summary(summary)
+        self.__remove_non_relevant_assertions(test_cases, executions, summary)
 
+    def _execute_on_mutants(
+        self, test_cases: list[tc.TestCase]
+    ) -> list[_MutantExecution]:
+        """Execute the given test cases on all mutants.
+
+        Args:
+            test_cases: The test cases to execute.
+
+        Returns:
+            For each mutant, the outcome of executing the test cases.
+        """
+        indices = [
+            idx for idx, origin in enumerate(self._mutant_origins) if idx == origin
+        ]
+        if len(indices) < len(self._mutated_modules):
+            _LOGGER.debug(
+                "Skipping %i mutant(s) identical to another mutant",
+                len(self._mutated_modules) - len(indices),
+            )
+        # The violated assertions of each test case that are known to be relevant.
+        known_violations: list[set[tuple[int, int]]] = [set() for _ in test_cases]
         with self._mutation_executor.temporarily_add_observer(
-            ato.AssertionVerificationObserver()
+            self._verification_observer
         ):
-            for idx, mutated_module in enumerate(self._mutated_modules):
-                self._logger.info(
-                    "Running tests on mutant %3i/%i",
-                    idx + 1,
-                    len(self._mutated_modules),
-                )
-                self._mutation_executor.module_provider.add_mutated_version(
-                    module_name=config.configuration.module_name,
-                    mutated_module=mutated_module,
+            if self._jobs > 1 and len(indices) > 1 and forking.can_fork():
+                executions = self._execute_on_mutants_in_parallel(
+                    indices, test_cases, known_violations
                 )
-                for test, results in tests_and_results:
-                    results.append(self._mutation_executor.execute(test))
+            else:
+                executions = [
+                    self._execute_on_mutant(idx, test_cases, known_violations)
+                    for idx in indices
+                ]
+        executed = dict(zip(indices, executions, strict=True))
+        return [executed[origin] for origin in self._mutant_origins]
+
+    def _execute_on_mutants_in_parallel(
+        self,
+        indices: list[int],
+        test_cases: list[tc.TestCase],
+        known_violations: list[set[tuple[int, int]]],
+    ) -> list[_MutantExecution]:
+        def on_error(idx: int, error: Exception) -> _MutantExecution:
+            # A crashing worker must not abort the analysis of the other mutants, so
+            # we treat this mutant like a timed out one, which excludes it from the
+            # analysis.
+            _LOGGER.error("Failed to execute tests on mutant %i", idx, exc_info=error)
+            return _MutantExecution.timed_out(len(test_cases))
+
+        # The worker processes inherit the mutants, the test cases and the executor,
+        # none of which can be pickled.  Each worker only learns about the violations
+        # on the mutants it executes itself.
+        return forking.map_in_forked_processes(
+            _execute_on_mutant_in_worker,
+            (self, test_cases, known_violations),
+            indices,
+            self._jobs,
+            on_error,
+        )
+
+    def _execute_on_mutant(
+        self,
+        idx: int,
+        test_cases: list[tc.TestCase],
+        known_violations: list[set[tuple[int, int]]],
+    ) -> _MutantExecution:
+        """Execute the given test cases on a single mutant.
+
+        Assertions that are known to be relevant are only verified as long as the
+        test case did not violate any other assertion, because they are kept anyway.
+        The known violations are extended by the ones on this mutant, unless it timed
+        out, which makes it irrelevant.
+
+        Args:
+            idx: The index of the mutant.
+            test_cases: The test cases to execute.
+            known_violations: The violated assertions of each test case that are
+                known to be relevant.
 
-        summary = self.__compute_mutation_summary(
-            len(self._mutated_modules), tests_and_results
+        Returns:
+            The outcome of executing the test cases.
+        """
+        self._logger.info(
+            "Running tests on mutant %3i/%i",
+            idx + 1,
+            len(self._mutated_modules),
         )
-        self.__report_mutation_summary(summary)
-        self.__remove_non_relevant_assertions(tests_and_results, summary)
+        self._mutation_executor.module_provider.add_mutated_version(
+            module_name=config.configuration.module_name,
+            mutated_module=self._mutated_modules[idx],
+        )
+        execution = _MutantExecution()
+        for test, known in zip(test_cases, known_violations, strict=True):
+            self._verification_observer.set_known_violations(known)
+            execution.append(self._mutation_executor.execute(test))
+        if not any(execution.timeouts):
+            for known, violations in zip(
+                known_violations, execution.violations, strict=True
+            ):
+                known.update(violations)
+        return execution
 
     @staticmethod
     def __remove_non_relevant_assertions(
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]],
+        test_cases: list[tc.TestCase],
+        executions: list[_MutantExecution],
         mutation_summary: _MutationSummary,
     ) -> None:
-        for test, results in tests_and_results:
-            merged = at.AssertionVerificationTrace()
-            for result, mut in zip(
-                results, mutation_summary.mutant_information, strict=True
-            ):
-                # Ignore timed out executions
-                if len(mut.timed_out_by) == 0:
-                    merged.merge(result.assertion_verification_trace)
+        # Timed out mutants are ignored.
+        relevant = [
+            execution
+            for execution, mut in zip(
+                executions, mutation_summary.mutant_information, strict=True
+            )
+            if len(mut.timed_out_by) == 0
+        ]
+        for test_idx, test in enumerate(test_cases):
+            violations: set[tuple[int, int]] = set()
+            for execution in relevant:
+                violations.update(execution.violations[test_idx])
             for stmt_idx, statement in enumerate(test.statements):
                 for assertion_idx, assertion in reversed(
                     list(enumerate(statement.assertions))
                 ):
-                    if not merged.was_violated(stmt_idx, assertion_idx):
+                    if (stmt_idx, assertion_idx) not in violations:
                         statement.assertions.remove(assertion)
 
     @staticmethod
     def __compute_mutation_summary(
-        number_of_mutants: int,
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]],
+        executions: list[_MutantExecution],
     ) -> _MutationSummary:
-        mutation_info = [_MutantInfo(i) for i in range(number_of_mutants)]
-        for test_num, (_, results) in enumerate(tests_and_results):
-            # For each mutation, check if we had a violated assertion
-            for info, result in zip(mutation_info, results, strict=True):
-                if info.timed_out_by:
-                    continue
-                if result.timeout:
-                    # Mutant caused timeout
+        mutation_info = []
+        for mut_num, execution in enumerate(executions):
+            info = _MutantInfo(mut_num)
+            for test_num, (timeout, killed) in enumerate(
+                zip(execution.timeouts, execution.kills, strict=True)
+            ):
+                if timeout:
+                    # Mutant caused timeout, the remaining tests are not relevant.
                     info.timed_out_by.append(test_num)
-                elif (
-                    len(result.assertion_verification_trace.error) > 0
-                    or len(result.assertion_verification_trace.failed) > 0
-                    or result.has_test_exceptions()
-                    # Execution with assertions should not raise exceptions.
-                    # If it does, it is probably an incompetent mutant
-                ):
+                    break
+                if killed:
                     info.killed_by.append(test_num)
+            mutation_info.append(info)
         return _MutationSummary(mutation_info)
 
     def __report_mutation_summary(self, mutation_summary: _MutationSummary):
@@ -388,3 +550,19 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             len(survived),
             ", ".join(str(x.mut_num) for x in survived),
         )
+
+
+def _execute_on_mutant_in_worker(
+    context: tuple[
+        MutationAnalysisAssertionGenerator,
+        list[tc.TestCase],
+        list[set[tuple[int, int]]],
+    ],
+    idx: int,
+) -> _MutantExecution:
+    # The outcome only consists of builtin values, thus it can be pickled to the
+    # parent process, unlike the raw execution results.
+    generator, test_cases, known_violations = context
+    return generator._execute_on_mutant(  # noqa: SLF001
+        idx, test_cases, known_violations
+    )
@@ -7,17 +7,22 @@
 """Provides an abstract observer that can be used to generate assertions."""
 import ast
 import copy
+import functools
 import logging
 import threading
 
+from collections.abc import Hashable
 from collections.abc import Sized
 from types import ModuleType
 from typing import cast
 
+import pytest
+
 from _pytest.outcomes import Failed  # noqa: PLC2701
 
 import pynguin.assertion.assertion as ass
 import pynguin.assertion.assertion_trace as at
+import pynguin.configuration as config
 import pynguin.testcase.execution as ex
 import pynguin.testcase.statement as st
 import pynguin.testcase.testcase as tc
@@ -26,6 +31,7 @@ import pynguin.utils.generic.genericaccessibleobject as gao
 
 from pynguin.analyses.typesystem import ANY
 from pynguin.analyses.typesystem import TypeInfo
+from pynguin.utils.type_utils import ASSERTABLE_SCALAR_TYPES
 from pynguin.utils.type_utils import is_assertable
 from pynguin.utils.type_utils import is_collection_type
 from pynguin.utils.type_utils import is_ignorable_type
@@ -35,6 +41,27 @@ from pynguin.utils.type_utils import is_primitive_type
 _LOGGER = logging.getLogger(__name__)
 
 
+def _type_names(typ: type) -> tuple[str, str] | None:
+    """Provides the module and the qualified name of the given type.
+
+    Args:
+        typ: The type.
+
+    Returns:
+        The module and the qualified name, or None, if the type does not have them.
+    """
+    return _cached_type_names(cast(Hashable, typ))
+
+
+# The names are looked up for the type of every checked value.  The cache keeps its
+# types alive, which is why it is bounded to a small number of types.
+@functools.lru_cache(maxsize=1024)
+def _cached_type_names(typ: type) -> tuple[str, str] | None:
+    if hasattr(typ, "__module__") and hasattr(typ, "__qualname__"):
+        return typ.__module__, typ.__qualname__
+    return None
+
+
 class AssertionTraceObserver(ex.ExecutionObserver):
     """Observer that creates assertions.
 
@@ -123,13 +150,11 @@ class AssertionTraceObserver(ex.ExecutionObserver):
         trace = self._assertion_local_state.trace
 
         if not statement.ret_val.is_none_type():
-            if is_primitive_type(type(exec_ctx.get_reference_value(statement.ret_val))):
+            ret_val_type = type(exec_ctx.get_reference_value(statement.ret_val))
+            if is_primitive_type(ret_val_type):
                 # Primitives won't change, so we only check them once.
                 self._check_reference(exec_ctx, statement.ret_val, position, trace)
-            elif (
-                type(exec_ctx.get_reference_value(statement.ret_val)).__module__
-                != "builtins"
-            ):
+            elif ret_val_type.__module__ != "builtins":
                 # Everything else is continually checked, unless it is from builtins.
                 self._assertion_local_state.watch_list.append(statement.ret_val)
 
@@ -158,11 +183,17 @@ class AssertionTraceObserver(ex.ExecutionObserver):
                     trace,
                 )
 
-        # Check fields of classes whose constructors were used.
+        # Check fields of classes whose constructors were used.  Several watched
+        # objects may share a type, but its static fields only need to be checked
+        # once, as they would result in the same assertions.
+        checked_types: set[type] = set()
         for seen_type in [
             type(exec_ctx.get_reference_value(ref))
             for ref in self._assertion_local_state.watch_list
         ]:
+            if seen_type in checked_types:
+                continue
+            checked_types.add(seen_type)
             if (
                 is_primitive_type(seen_type)
                 or is_collection_type(seen_type)
@@ -173,6 +204,7 @@ class AssertionTraceObserver(ex.ExecutionObserver):
             if not hasattr(seen_type, "__dict__"):
                 continue
 
+            owner = TypeInfo(seen_type)
             for field, value in vars(seen_type).items():
                 if self._should_ignore(field, value):
                     continue
@@ -180,7 +212,7 @@ class AssertionTraceObserver(ex.ExecutionObserver):
                     exec_ctx,
                     vr.StaticFieldReference(
                         # Type information is not used here, so use Any.
-                        gao.GenericStaticField(TypeInfo(seen_type), field, ANY)
+                        gao.GenericStaticField(owner, field, ANY)
                     ),
                     position,
                     trace,
@@ -217,12 +249,8 @@ class AssertionTraceObserver(ex.ExecutionObserver):
             trace.add_entry(position, ass.ObjectAssertion(ref, copy.deepcopy(value)))
         else:
             # No precise assertion possible, so assert on type.
-            typ = type(value)
-            if hasattr(typ, "__module__") and hasattr(typ, "__qualname__"):
-                trace.add_entry(
-                    position,
-                    ass.TypeNameAssertion(ref, typ.__module__, typ.__qualname__),
-                )
+            if (names := _type_names(type(value))) is not None:
+                trace.add_entry(position, ass.TypeNameAssertion(ref, *names))
             if isinstance(value, Sized):
                 try:
                     length = len(value)
@@ -236,6 +264,7 @@ class AssertionTraceObserver(ex.ExecutionObserver):
             if depth < max_depth and hasattr(value, "__dict__"):
                 # Reference is a complex object.
                 # Try to assert something on its fields.
+                owner = TypeInfo(type(value))
                 for field, field_value in vars(value).items():
                     if not self._should_ignore(field, field_value):
                         self._check_reference(
@@ -243,7 +272,7 @@ class AssertionTraceObserver(ex.ExecutionObserver):
                             vr.FieldReference(
                                 ref,
                                 # Type information is not used here, so use Any.
-                                gao.GenericField(TypeInfo(type(value)), field, ANY),
+                                gao.GenericField(owner, field, ANY),
                             ),
                             position,
                             trace,
@@ -269,16 +298,37 @@ class AssertionVerificationObserver(ex.ExecutionObserver):
         def __init__(self):  # noqa: D107
             super().__init__()
             self.trace = at.AssertionVerificationTrace()
+            # The positions of the statements of the executed test case.
+            self.positions: dict[st.Statement, int] = {}
 
     def __init__(self):  # noqa: D107
         self.state = AssertionVerificationObserver.AssertionExecutorLocalState()
+        self._known_violations: set[tuple[int, int]] = set()
+
+    def set_known_violations(self, violations: set[tuple[int, int]]) -> None:
+        """Set the assertions of the next test case that are known to be violated.
+
+        Once the test case violated an assertion, verifying these assertions does not
+        provide any new information, thus they are skipped.
+
+        Args:
+            violations: The (statement position, assertion index) pairs of the
+                assertions that were already violated on another mutant.
+        """
+        self._known_violations = violations
 
     def before_test_case_execution(self, test_case: tc.TestCase):
-        """Not used.
+        """Index the positions of the statements of the test case.
+
+        Looking up the position of a statement in the test case is linear in its
+        position, thus we compute all positions once per execution.
 
         Args:
-            test_case: Not used
+            test_case: The test case that is executed.
         """
+        self.state.positions = {
+            statement: idx for idx, statement in enumerate(test_case.statements)
+        }
 
     def after_test_case_execution_inside_thread(  # noqa: D102
         self, test_case: tc.TestCase, result: ex.ExecutionResult
@@ -309,6 +359,7 @@ class AssertionVerificationObserver(ex.ExecutionObserver):
         exec_ctx: ex.ExecutionContext,
         exception: BaseException | None,
     ) -> None:
+        position = self.state.positions[statement]
         if statement.has_only_exception_assertion():
             if exception is None:
                 return
@@ -316,22 +367,94 @@ class AssertionVerificationObserver(ex.ExecutionObserver):
             # exception.
             if isinstance(exception, Failed):
                 # Failed indicates that the expected assertion was not raised
-                self.state.trace.failed[statement.get_position()].add(0)
+                self.state.trace.failed[position].add(0)
             else:
-                self.state.trace.error[statement.get_position()].add(0)
+                self.state.trace.error[position].add(0)
         else:
             # Other assertions are executed after the statement.
+            trace = self.state.trace
             for idx, assertion in enumerate(statement.assertions):
-                exc = executor.execute_ast(
-                    exec_ctx.wrap_node_in_module(
-                        exec_ctx.node_for_assertion(assertion, ast.stmt())
-                    ),
-                    exec_ctx,
-                )
+                if (position, idx) in self._known_violations and (
+                    trace.failed or trace.error
+                ):
+                    continue
+                exc = self._check_assertion(assertion, executor, exec_ctx)
                 if exc is None:
                     continue
 
                 if isinstance(exc, AssertionError):
-                    self.state.trace.failed[statement.get_position()].add(idx)
+                    trace.failed[position].add(idx)
                 else:
-                    self.state.trace.error[statement.get_position()].add(idx)
+                    trace.error[position].add(idx)
+
+    @staticmethod
+    def _check_assertion(
+        assertion: ass.Assertion,
+        executor: ex.TestCaseExecutor,
+        exec_ctx: ex.ExecutionContext,
+    ) -> BaseException | None:
+        """Check if the given assertion holds.
+
+        Simple assertions are checked directly, which avoids compiling and executing
+        the AST of the assertion.  This is not possible, if the executed assertions
+        have to be instrumented.  All other assertions are executed.
+
+        Args:
+            assertion: The assertion to check.
+            executor: The executor that executes the test case.
+            exec_ctx: The execution context.
+
+        Returns:
+            The raised exception, if any.  An AssertionError indicates that the
+            assertion does not hold.
+        """
+        if not executor.instrument:
+            try:
+                holds = AssertionVerificationObserver._check_directly(
+                    assertion, exec_ctx
+                )
+            except BaseException as err:  # noqa: BLE001
+                return err
+            if holds is not None:
+                return None if holds else AssertionError()
+        return executor.execute_ast(
+            exec_ctx.wrap_node_in_module(
+                exec_ctx.node_for_assertion(assertion, ast.stmt())
+            ),
+            exec_ctx,
+        )
+
+    @staticmethod
+    def _check_directly(
+        assertion: ass.Assertion, exec_ctx: ex.ExecutionContext
+    ) -> bool | None:
+        """Evaluate the comparison that the AST of the assertion would perform.
+
+        Args:
+            assertion: The assertion to check.
+            exec_ctx: The execution context.
+
+        Returns:
+            Whether the assertion holds, or None, if it cannot be checked directly.
+        """
+        if isinstance(assertion, ass.FloatAssertion):
+            precision = config.configuration.test_case_output.float_precision
+            value = exec_ctx.get_reference_value(assertion.source)
+            return bool(
+                value
+                == pytest.approx(float(assertion.value), abs=precision, rel=precision)
+            )
+        if isinstance(assertion, ass.CollectionLengthAssertion):
+            value = exec_ctx.get_reference_value(assertion.source)
+            return len(value) == assertion.length
+        if (
+            isinstance(assertion, ass.ObjectAssertion)
+            # Such assertions compare against a constant, thus they can be checked
+            # without executing the assertion.
+            and type(assertion.object) in ASSERTABLE_SCALAR_TYPES
+        ):
+            value = exec_ctx.get_reference_value(assertion.source)
+            if isinstance(assertion.object, bool | type(None)):
+                return value is assertion.object
+            return bool(value == assertion.object)
+        return None
@@ -7,10 +7,16 @@
 """Provides an adapter for the MutPy mutation testing framework."""
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import pickle  # noqa: S403
+import sys
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import mutpy
 import mutpy.controller as mc
 import mutpy.operators as mo
 import mutpy.operators.loop as mol
@@ -19,10 +25,14 @@ import mutpy.views as mv
 
 import pynguin.configuration as config
 
+from pynguin.__version__ import __version__
+from pynguin.utils import forking
 from pynguin.utils.exceptions import ConfigurationException
 
 
 if TYPE_CHECKING:
+    import ast
+
     from collections.abc import Callable
     from types import ModuleType
     from typing import ClassVar
@@ -43,8 +53,16 @@ class MutationAdapter:
         config.MutationStrategy.EACH_CHOICE: mc.EachChoiceHOMStrategy,
     }
 
-    def __init__(self):  # noqa: D107
+    def __init__(self, jobs: int = 1):
+        """Initializes the adapter.
+
+        Args:
+            jobs: The number of worker processes used to generate first-order
+                mutants.  Requires the fork start method of multiprocessing,
+                otherwise the mutants are generated sequentially.
+        """
         self.target_loader: mu.ModulesLoader | None = None
+        self._jobs = jobs
 
     def mutate_module(self) -> list[tuple[ModuleType, list[mo.Mutation]]]:
         """Mutates the modules specified in the configuration.
@@ -65,16 +83,190 @@ class MutationAdapter:
                 _LOGGER.info("Build AST for %s", target_module.__name__)
                 target_ast = controller.create_target_ast(target_module)
                 _LOGGER.info("Mutate module %s", target_module.__name__)
-                mutant_modules = controller.mutate_module(
-                    target_module=target_module,
-                    to_mutate=to_mutate,
-                    target_ast=target_ast,
+                mutants.extend(
+                    self._mutate_target(
+                        controller, target_module, to_mutate, target_ast
+                    )
                 )
-                for mutant_module, mutations in mutant_modules:
-                    mutants.append((mutant_module, mutations))
         _LOGGER.info("Generated %d mutants", len(mutants))
         return mutants
 
+    def _mutate_target(
+        self,
+        controller: mc.MutationController,
+        target_module: ModuleType,
+        to_mutate: str | None,
+        target_ast: ast.Module,
+    ) -> list[tuple[ModuleType, list[mo.Mutation]]]:
+        cache_file = self._get_cache_file(controller, target_module, to_mutate)
+        if cache_file is not None and cache_file.is_file():
+            cached = self._load_from_cache(cache_file)
+            if cached is not None:
+                return self._create_mutant_modules(controller, target_module, cached)
+
+        snapshots: list[bytes]
+        if self._can_mutate_in_parallel(controller):
+            snapshots = self._mutate_in_parallel(
+                controller, target_module, to_mutate, target_ast
+            )
+            mutants = self._create_mutant_modules(
+                controller,
+                target_module,
+                [pickle.loads(snapshot) for snapshot in snapshots],  # noqa: S301
+            )
+        else:
+            mutants = []
+            snapshots = []
+            for mutations, mutant_ast in controller.mutant_generator.mutate(
+                target_ast, to_mutate, module=target_module
+            ):
+                if cache_file is not None:
+                    # The generator modifies the AST in place, thus we have to take
+                    # a snapshot of each mutant.
+                    snapshots.append(pickle.dumps((mutant_ast, mutations)))
+                mutants.append(
+                    (
+                        controller.create_mutant_module(target_module, mutant_ast),
+                        mutations,
+                    )
+                )
+        if cache_file is not None:
+            self._store_in_cache(cache_file, snapshots)
+        return mutants
+
+    def _can_mutate_in_parallel(self, controller: mc.MutationController) -> bool:
+        # Higher-order mutants combine mutations of different operators, thus only
+        # first-order mutants can be generated independently per operator.
+        return (
+            self._jobs > 1
+            and type(controller.mutant_generator) is mc.FirstOrderMutator
+            and len(controller.mutant_generator.operators) > 1
+            and forking.can_fork()
+        )
+
+    def _mutate_in_parallel(
+        self,
+        controller: mc.MutationController,
+        target_module: ModuleType,
+        to_mutate: str | None,
+        target_ast: ast.Module,
+    ) -> list[bytes]:
+        mutant_generator = controller.mutant_generator
+        # The worker processes inherit the target, because the target module cannot
+        # be pickled.
+        context = (target_ast, to_mutate, target_module, mutant_generator)
+
+        def on_error(
+            operator: type[mo.MutationOperator], error: Exception
+        ) -> list[bytes]:
+            _LOGGER.warning(
+                "Failed to generate mutants with %s in a worker process: %s",
+                operator.__name__,
+                error,
+            )
+            return _mutate_with_operator(context, operator)
+
+        # Keep the order of the operators, such that the mutants are in the same order
+        # as with sequential generation.
+        snapshots_per_operator = forking.map_in_forked_processes(
+            _mutate_with_operator,
+            context,
+            mu.sort_operators(mutant_generator.operators),
+            self._jobs,
+            on_error,
+        )
+        return [
+            snapshot for snapshots in snapshots_per_operator for snapshot in snapshots
+        ]
+
+    @staticmethod
+    def _create_mutant_modules(
+        controller: mc.MutationController,
+        target_module: ModuleType,
+        mutant_asts: list[tuple[ast.Module, list[mo.Mutation]]],
+    ) -> list[tuple[ModuleType, list[mo.Mutation]]]:
+        mutants = []
+        for mutant_ast, mutations in mutant_asts:
+            mutants.append(
+                (controller.create_mutant_module(target_module, mutant_ast), mutations)
+            )
+        return mutants
+
+    @staticmethod
+    def _get_cache_file(
+        controller: mc.MutationController,
+        target_module: ModuleType,
+        to_mutate: str | None,
+    ) -> Path | None:
+        cache_directory = config.configuration.test_case_output.mutation_cache_directory
+        if not cache_directory or (
+            config.configuration.test_case_output.mutation_strategy
+            == config.MutationStrategy.RANDOM
+        ):
+            # Mutants from the random strategy must not be reused.
+            return None
+        key = hashlib.blake2b()
+        for part in (
+            # Pickled ASTs are specific to the version of the interpreter.
+            sys.version,
+            __version__,
+            mutpy.__version__,
+            target_module.__name__,
+            str(to_mutate),
+            *sorted(
+                operator.__name__ for operator in controller.mutant_generator.operators
+            ),
+            config.configuration.test_case_output.mutation_strategy.value,
+            str(config.configuration.test_case_output.mutation_order),
+        ):
+            key.update(part.encode())
+            key.update(b"\0")
+        # The mutants are generated from the source file of the module.
+        key.update(Path(target_module.__file__).read_bytes())  # type: ignore[arg-type]
+        return Path(cache_directory).expanduser() / f"{key.hexdigest()}.pkl"
+
+    @staticmethod
+    def _load_from_cache(
+        cache_file: Path,
+    ) -> list[tuple[ast.Module, list[mo.Mutation]]] | None:
+        _LOGGER.info("Load cached mutants from %s", cache_file)
+        try:
+            with cache_file.open("rb") as file:
+                snapshots: list[bytes] = pickle.load(file)  # noqa: S301
+            mutant_asts = []
+            for snapshot in snapshots:
+                mutant_ast, mutations = pickle.loads(snapshot)  # noqa: S301
+                mutant_asts.append((mutant_ast, mutations))
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ) as error:
+            # The cache file is corrupt or stale, e.g., it references classes that
+            # no longer exist, thus we generate the mutants again.
+            _LOGGER.warning(
+                "Failed to load cached mutants from %s: %s", cache_file, error
+            )
+            return None
+        return mutant_asts
+
+    @staticmethod
+    def _store_in_cache(cache_file: Path, snapshots: list[bytes]) -> None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, such that concurrent runs never read
+            # a partially written cache file.
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_file.open("wb") as file:
+                pickle.dump(snapshots, file)
+            tmp_file.replace(cache_file)
+        except OSError as error:
+            _LOGGER.warning("Failed to cache mutants in %s: %s", cache_file, error)
+
     def _build_mutation_controller(self) -> mc.MutationController:
         _LOGGER.info("Setup mutation controller")
         built_views = self._get_views()
@@ -123,3 +315,16 @@ class MutationAdapter:
     def _get_views() -> list[mv.QuietTextView]:
         # We do not want any output from MutPy here
         return [mv.QuietTextView()]
+
+
+def _mutate_with_operator(
+    context: tuple[ast.Module, str | None, ModuleType, mc.FirstOrderMutator],
+    operator: type[mo.MutationOperator],
+) -> list[bytes]:
+    target_ast, to_mutate, target_module, mutant_generator = context
+    return [
+        pickle.dumps((mutant_ast, [mutation]))
+        for mutation, mutant_ast in operator().mutate(
+            target_ast, to_mutate, mutant_generator.sampler, module=target_module
+        )
+    ]
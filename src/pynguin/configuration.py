@@ -247,6 +247,18 @@ class TestCaseOutputConfiguration:
     """The order of the generated higher order mutants in the mutation analysis
     assertion generation method."""
 
+    mutation_cache_directory: str = ""
+    """Path to a directory where the mutants generated for the mutation analysis
+    assertion generation method are cached across runs, for example,
+    ~/.cache/pynguin/mutants.  The mutants are not cached if no path is given."""
+
+    mutation_jobs: int = 1
+    """The number of worker processes used by the mutation analysis assertion
+    generation method.  They generate the first-order mutants, one mutation operator
+    per process, and execute the test cases on the mutants.  A value greater than one
+    requires the fork start method of multiprocessing, otherwise the mutants are
+    generated and executed sequentially."""
+
     post_process: bool = True
     """Should the results be post processed? For example, truncate test cases after
     statements that raise an exception."""
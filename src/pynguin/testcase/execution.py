@@ -2208,6 +2208,15 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         """
         return self._tracer
 
+    @property
+    def instrument(self) -> bool:
+        """Whether the test and its assertions are instrumented as well.
+
+        Returns:
+            Whether the test and its assertions are instrumented.
+        """
+        return self._instrument
+
     def set_instrument(self, instrument: bool) -> None:  # noqa: FBT001
         """Set if the test is to be instrumented as well.
 
@@ -0,0 +1,123 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2024 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a way to map a function over items in forked worker processes.
+
+The worker processes are forked, thus they inherit a context object from the parent
+process, which does not have to be picklable.  Only the items, the results and the
+function itself, which must be defined on module level, are pickled.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import logging
+import multiprocessing
+
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_C = TypeVar("_C")
+_I = TypeVar("_I")
+_R = TypeVar("_R")
+
+# The context that is inherited by the forked worker processes.
+_CONTEXT: Any = None
+
+
+def can_fork() -> bool:
+    """Whether worker processes can be forked on this platform.
+
+    Returns:
+        Whether the fork start method of multiprocessing is available.
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def map_in_forked_processes(
+    function: Callable[[_C, _I], _R],
+    context: _C,
+    items: Sequence[_I],
+    max_workers: int,
+    on_error: Callable[[_I, Exception], _R],
+) -> list[_R]:
+    """Calls the function with the context and each item in forked worker processes.
+
+    If the call for an item raises an exception, the result for this item is provided
+    by `on_error`.  If a worker process dies, e.g., by a segmentation fault, all
+    calls that did not finish are repeated one after another in a single new worker
+    process, such that the item that crashes the worker can be identified and the
+    results of all other items are still computed.
+
+    Args:
+        function: The function to call, must be defined on module level.
+        context: The first argument to the function, inherited by the workers.
+        items: The items to pass as second argument to the function.
+        max_workers: The maximum number of worker processes.
+        on_error: Provides the result for an item whose call failed.
+
+    Returns:
+        The results in the order of the items.
+    """
+    global _CONTEXT  # noqa: PLW0603
+    results: dict[int, _R] = {}
+    pending = list(range(len(items)))
+    workers = min(max_workers, len(items))
+    _CONTEXT = context
+    try:
+        while pending:
+            broken: list[int] = []
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                futures: list[concurrent.futures.Future[_R]] = []
+                # Submitting fails once a worker died, thus we keep the futures of
+                # the items submitted so far.
+                with contextlib.suppress(BrokenProcessPool):
+                    for idx in pending:
+                        futures.append(  # noqa: PERF401
+                            pool.submit(_call, function, items[idx])
+                        )
+                for idx, future in zip(pending, futures, strict=False):
+                    # The failure of an item must not affect the other items.
+                    try:
+                        results[idx] = future.result()
+                    except BrokenProcessPool:  # noqa: PERF203
+                        broken.append(idx)
+                    except Exception as error:  # noqa: BLE001
+                        results[idx] = on_error(items[idx], error)
+                broken.extend(pending[len(futures) :])
+            if broken and workers == 1:
+                # A single worker executes the items in order, thus the first
+                # unfinished item is the one that crashed it.
+                crashed = broken.pop(0)
+                results[crashed] = on_error(
+                    items[crashed], BrokenProcessPool("Worker process died")
+                )
+            if broken:
+                _LOGGER.warning(
+                    "A worker process died, repeating %i unfinished call(s)",
+                    len(broken),
+                )
+            workers = 1
+            pending = broken
+    finally:
+        _CONTEXT = None
+    return [results[idx] for idx in range(len(items))]
+
+
+def _call(function: Callable[[Any, _I], _R], item: _I) -> _R:
+    return function(_CONTEXT, item)
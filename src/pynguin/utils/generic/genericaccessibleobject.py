@@ -41,6 +41,8 @@ if typing.TYPE_CHECKING:
 class GenericAccessibleObject(abc.ABC):
     """Abstract base class for something that can be accessed."""
 
+    __slots__ = ("_owner",)
+
     def __init__(self, owner: TypeInfo | None):
         """Constructor.
 
@@ -136,6 +138,8 @@ class GenericAccessibleObject(abc.ABC):
 class GenericEnum(GenericAccessibleObject):
     """Models an enum."""
 
+    __slots__ = ("_generated_type", "_names")
+
     def __init__(self, owner: TypeInfo):
         """Constructs an enum-representing object.
 
@@ -188,6 +192,8 @@ class GenericEnum(GenericAccessibleObject):
 class GenericCallableAccessibleObject(GenericAccessibleObject, abc.ABC):
     """Abstract base class for something that can be called."""
 
+    __slots__ = ("_callable", "_inferred_signature", "_raised_exceptions")
+
     def __init__(
         self,
         owner: TypeInfo | None,
@@ -250,6 +256,8 @@ class GenericCallableAccessibleObject(GenericAccessibleObject, abc.ABC):
 class GenericConstructor(GenericCallableAccessibleObject):
     """A constructor."""
 
+    __slots__ = ("_generated_type", "_hash")
+
     def __init__(
         self,
         owner: TypeInfo,
@@ -270,6 +278,7 @@ class GenericConstructor(GenericCallableAccessibleObject):
             raised_exceptions,
         )
         self._generated_type = Instance(owner)
+        self._hash = hash(owner)
 
     def generated_type(self) -> ProperType:  # noqa: D102
         return self._generated_type
@@ -285,7 +294,7 @@ class GenericConstructor(GenericCallableAccessibleObject):
         return self._owner == other._owner
 
     def __hash__(self):
-        return hash(self._owner)
+        return self._hash
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.owner}, {self.inferred_signature})"
@@ -298,6 +307,8 @@ class GenericConstructor(GenericCallableAccessibleObject):
 class GenericMethod(GenericCallableAccessibleObject):
     """A method."""
 
+    __slots__ = ("_generated_type", "_hash", "_method_name")
+
     def __init__(
         self,
         owner: TypeInfo,
@@ -318,6 +329,8 @@ class GenericMethod(GenericCallableAccessibleObject):
         super().__init__(owner, method, inferred_signature, raised_exceptions)
         self._generated_type = inferred_signature.return_type
         self._method_name = method_name
+        # The callable might not be hashable, thus we compute its hash on first use.
+        self._hash: int | None = None
 
     @property
     def owner(self) -> TypeInfo:  # noqa: D102
@@ -352,7 +365,9 @@ class GenericMethod(GenericCallableAccessibleObject):
         return self._callable == other._callable
 
     def __hash__(self):
-        return hash(self._callable)
+        if self._hash is None:
+            self._hash = hash(self._callable)
+        return self._hash
 
     def __repr__(self):
         return (
@@ -367,6 +382,8 @@ class GenericMethod(GenericCallableAccessibleObject):
 class GenericFunction(GenericCallableAccessibleObject):
     """A function, which does not belong to any class."""
 
+    __slots__ = ("_function_name", "_hash")
+
     def __init__(
         self,
         function: FunctionType,
@@ -385,6 +402,8 @@ class GenericFunction(GenericCallableAccessibleObject):
         """
         self._function_name = function_name
         super().__init__(None, function, inferred_signature, raised_exceptions)
+        # The callable might not be hashable, thus we compute its hash on first use.
+        self._hash: int | None = None
 
     def is_function(self) -> bool:  # noqa: D102
         return True
@@ -406,7 +425,9 @@ class GenericFunction(GenericCallableAccessibleObject):
         return self._callable == other._callable
 
     def __hash__(self):
-        return hash(self._callable)
+        if self._hash is None:
+            self._hash = hash(self._callable)
+        return self._hash
 
     def __repr__(self):
         return (
@@ -421,6 +442,8 @@ class GenericFunction(GenericCallableAccessibleObject):
 class GenericAbstractField(GenericAccessibleObject, abc.ABC):
     """Abstract superclass for fields."""
 
+    __slots__ = ("_field", "_field_type")
+
     def __init__(
         self, owner: TypeInfo | None, field: str, field_type: ProperType
     ) -> None:
@@ -454,6 +477,8 @@ class GenericAbstractField(GenericAccessibleObject, abc.ABC):
 class GenericField(GenericAbstractField):
     """A field of an object."""
 
+    __slots__ = ("_hash",)
+
     def __init__(self, owner: TypeInfo, field: str, field_type: ProperType):
         """Initializes a new field wrapper.
 
@@ -464,6 +489,7 @@ class GenericField(GenericAbstractField):
         """
         super().__init__(owner, field, field_type)
         assert owner is not None, "Field must have an owner"
+        self._hash = hash((owner, field))
 
     def get_dependencies(  # noqa: D102
         self, memo: dict[InferredSignature, dict[str, ProperType]]
@@ -484,7 +510,7 @@ class GenericField(GenericAbstractField):
         return self._owner == other._owner and self._field == other._field
 
     def __hash__(self):
-        return hash((self._owner, self._field))
+        return self._hash
 
     def __repr__(self):
         return (
@@ -496,6 +522,8 @@ class GenericField(GenericAbstractField):
 class GenericStaticField(GenericAbstractField):
     """Static field of a class."""
 
+    __slots__ = ("_hash",)
+
     def __init__(self, owner: TypeInfo, field: str, field_type: ProperType):
         """Initializes a new object for a static field.
 
@@ -506,6 +534,7 @@ class GenericStaticField(GenericAbstractField):
         """
         super().__init__(owner, field, field_type)
         assert owner is not None, "Field must have an owner"
+        self._hash = hash((owner, field))
 
     def is_static(self) -> bool:  # noqa: D102
         return True
@@ -523,12 +552,7 @@ class GenericStaticField(GenericAbstractField):
         return self._owner == other._owner and self._field == other._field
 
     def __hash__(self):
-        return hash(
-            (
-                self._owner,
-                self._field,
-            )
-        )
+        return self._hash
 
     def __repr__(self):
         return (
@@ -540,6 +564,8 @@ class GenericStaticField(GenericAbstractField):
 class GenericStaticModuleField(GenericAbstractField):
     """Static fields defined in a module."""
 
+    __slots__ = ("_module",)
+
     # TODO(fk) combine with regular static field?
 
     def __init__(self, module: str, field: str, field_type: ProperType) -> None:
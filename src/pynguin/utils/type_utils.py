@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import inspect
 import numbers
 import types
@@ -22,11 +23,40 @@ from pynguin.utils.orderedset import OrderedSet
 
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from pynguin.analyses.typesystem import InferredSignature
 
 PRIMITIVES = OrderedSet([int, str, bytes, bool, float, complex])
 COLLECTIONS = OrderedSet([list, set, tuple, dict])
 IGNORABLE_TYPES = OrderedSet(["builtins.generator", "builtins.async_generator"])
+# The most common assertable types.  Values of these types are compared against
+# constants, which is checked before anything else.
+ASSERTABLE_SCALAR_TYPES = frozenset({int, str, bytes, type(None), bool})
+
+# Flags describing the builtin types in PRIMITIVES and COLLECTIONS, such that the
+# type predicates below only need a single lookup for them.
+_PRIMITIVE = 1
+_COLLECTION = 2
+_NUMERIC = 4
+_STRING = 8
+_BYTES = 16
+
+
+def _kind(typ: type) -> int:
+    # Derive the flags from the same rules as the type predicates use.
+    return (
+        (_PRIMITIVE if typ in PRIMITIVES else 0)
+        | (_COLLECTION if typ in COLLECTIONS else 0)
+        | (_NUMERIC if issubclass(typ, numbers.Number) else 0)
+        | (_STRING if issubclass(typ, str) else 0)
+        | (_BYTES if issubclass(typ, bytes | bytearray) else 0)
+    )
+
+
+_KINDS: dict[type | None, int] = {
+    typ: _kind(typ) for typ in (*PRIMITIVES, *COLLECTIONS, bytearray)
+}
 
 
 def is_primitive_type(typ: type | None) -> bool:
@@ -38,7 +68,7 @@ def is_primitive_type(typ: type | None) -> bool:
     Returns:
         Whether the type is a primitive type
     """
-    return typ in PRIMITIVES
+    return bool(_KINDS.get(typ, 0) & _PRIMITIVE)
 
 
 def is_collection_type(typ: type | None) -> bool:
@@ -50,7 +80,20 @@ def is_collection_type(typ: type | None) -> bool:
     Returns:
         Whether the type is a collection type
     """
-    return typ in COLLECTIONS or get_origin(typ) in COLLECTIONS
+    return _is_collection_type(typing.cast("Hashable", typ))
+
+
+# The assertion trace observer checks the same few types over and over, thus we cache
+# the following checks.  A cache keeps its types alive, which is why the caches are
+# bounded to a small number of types.
+@functools.lru_cache(maxsize=1024)
+def _is_collection_type(typ: type | None) -> bool:
+    return bool((_KINDS.get(typ, 0) | _KINDS.get(get_origin(typ), 0)) & _COLLECTION)
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_ignorable_type(typ: type) -> bool:
+    return f"{typ.__module__}.{typ.__name__}" in IGNORABLE_TYPES
 
 
 def is_ignorable_type(typ: type) -> bool:
@@ -79,7 +122,7 @@ def is_ignorable_type(typ: type) -> bool:
     Returns:
         Whether the type is ignorable
     """
-    return f"{typ.__module__}.{typ.__name__}" in IGNORABLE_TYPES
+    return _is_ignorable_type(typing.cast("Hashable", typ))
 
 
 def is_none_type(typ: type | None) -> bool:
@@ -103,6 +146,8 @@ def is_numeric(value: Any) -> bool:
     Returns:
         Whether or not the given value is numeric
     """
+    if (kind := _KINDS.get(type(value))) is not None:
+        return bool(kind & _NUMERIC)
     return isinstance(value, numbers.Number)
 
 
@@ -115,6 +160,8 @@ def is_string(value: Any) -> bool:
     Returns:
         Whether or not the given value is a string
     """
+    if (kind := _KINDS.get(type(value))) is not None:
+        return bool(kind & _STRING)
     return isinstance(value, str)
 
 
@@ -127,6 +174,8 @@ def is_bytes(value: Any) -> bool:
     Returns:
         Whether or not the given value is of type bytes or bytearray
     """
+    if (kind := _KINDS.get(type(value))) is not None:
+        return bool(kind & _BYTES)
     return isinstance(value, bytes | bytearray)
 
 
@@ -211,11 +260,13 @@ def is_assertable(obj: Any, recursion_depth: int = 0) -> bool:
     if recursion_depth > 4:
         # Object is possibly nested to deep to make a sensible assertion on.
         return False
+    tp_ = type(obj)
+    if tp_ in ASSERTABLE_SCALAR_TYPES:
+        return True
     if isinstance(obj, float):
         # Creating exact assertions on float values is usually not desirable.
         return False
 
-    tp_ = type(obj)
     if is_enum(tp_) or is_primitive_type(tp_) or is_none_type(tp_):
         return True
     if is_set(tp_) or is_list(tp_) or is_tuple(tp_):
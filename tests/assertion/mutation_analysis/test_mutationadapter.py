@@ -4,12 +4,16 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import ast
+import types
+
 from unittest import mock
 from unittest.mock import MagicMock
 
 import mutpy.controller
 
 import pynguin.assertion.mutation_analysis.mutationadapter as ma
+import pynguin.configuration as config
 
 
 class FooAdapter(ma.MutationAdapter):
@@ -35,3 +39,50 @@ def test_mutate_module():
             adapter.mutate_module()
             mock_obj.assert_called_once()
             mutated.assert_called_once()
+
+
+def _mutant_sources(jobs: int = 1) -> list[str]:
+    sources = []
+
+    def create_module(ast_node, module_name="mutant"):
+        sources.append(ast.unparse(ast_node))
+        return types.ModuleType(module_name)
+
+    with mock.patch("mutpy.utils.create_module", create_module):
+        ma.MutationAdapter(jobs=jobs).mutate_module()
+    return sources
+
+
+def test_mutate_module_cached(tmp_path):
+    config.configuration.module_name = "tests.fixtures.mutation.mutation"
+    config.configuration.test_case_output.mutation_cache_directory = str(tmp_path)
+    generated = _mutant_sources()
+    assert len(generated) == 5
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    with mock.patch.object(mutpy.controller.FirstOrderMutator, "mutate") as mutate_mock:
+        assert _mutant_sources() == generated
+        mutate_mock.assert_not_called()
+
+
+def test_mutate_module_corrupt_cache(tmp_path):
+    config.configuration.module_name = "tests.fixtures.mutation.mutation"
+    config.configuration.test_case_output.mutation_cache_directory = str(tmp_path)
+    generated = _mutant_sources()
+    (cache_file,) = tmp_path.glob("*.pkl")
+    cache_file.write_bytes(b"corrupt")
+    assert _mutant_sources() == generated
+    assert _mutant_sources() == generated
+
+
+def test_mutate_module_not_cached_for_random_strategy(tmp_path):
+    config.configuration.test_case_output.mutation_cache_directory = str(tmp_path)
+    config.configuration.test_case_output.mutation_strategy = (
+        config.MutationStrategy.RANDOM
+    )
+    assert ma.MutationAdapter._get_cache_file(MagicMock(), ma, None) is None
+
+
+def test_mutate_module_parallel():
+    config.configuration.module_name = "tests.fixtures.mutation.mutation"
+    assert _mutant_sources(jobs=2) == _mutant_sources()
@@ -312,3 +312,46 @@ def test_mutation_analysis_integration_full(  # noqa: PLR0917
             if "_execute_test_case" in thread.name:
                 thread.join()
         assert len(threading.enumerate()) == 1  # Only main thread should be alive.
+
+
+def test_mutation_analysis_integration_parallel():
+    config.configuration.module_name = "tests.fixtures.mutation.mutation"
+    module_name = config.configuration.module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        importlib.reload(importlib.import_module(module_name))
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(
+            cluster, False, EmptyConstantProvider()  # noqa: FBT003
+        )
+        transformer.visit(
+            ast.parse(
+                "def test_case_0():\n    int_0 = 1\n    float_0 = module_0.foo(int_0)"
+            )
+        )
+        test_case = transformer.testcases[0]
+
+        chromosome = tcc.TestCaseChromosome(test_case)
+        suite = tsc.TestSuiteChromosome()
+        suite.add_test_case_chromosome(chromosome)
+
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(tracer), testing=True, jobs=2
+        )
+        suite.accept(gen)
+
+        summary = gen._testing_mutation_summary
+        assert {k.mut_num for k in summary.get_killed()} == {0, 1, 3, 4}
+        assert summary.get_metrics() == ag._MutationMetrics(5, 4, 0)
+        visitor = tc_to_ast.TestCaseToAstVisitor(ns.NamingScope(prefix="module"), set())
+        test_case.accept(visitor)
+        source = ast.unparse(
+            ast.fix_missing_locations(
+                ast.Module(body=visitor.test_case_ast, type_ignores=[])
+            )
+        )
+        assert source == (
+            "int_0 = 1\nfloat_0 = module_0.foo(int_0)\n"
+            "assert float_0 == pytest.approx(2.0, abs=0.01, rel=0.01)"
+        )
@@ -66,18 +66,13 @@ def test_get_assertions(assertion_trace):
     assert assertion_trace.get_assertions(statement) == OrderedSet([entry])
 
 
-def test_merge():
-    ver_trace = at.AssertionVerificationTrace()
-    assert not ver_trace.was_violated(0, 0)
-
-
-def test_merge_2():
-    ver_trace = at.AssertionVerificationTrace()
-    ver_trace.error[0].add(0)
-    assert ver_trace.was_violated(0, 0)
+def test_get_violations_empty():
+    assert at.AssertionVerificationTrace().get_violations() == set()
 
 
-def test_merge_3():
+def test_get_violations():
     ver_trace = at.AssertionVerificationTrace()
-    ver_trace.failed[0].add(0)
-    assert ver_trace.was_violated(0, 0)
+    ver_trace.failed[0].add(1)
+    ver_trace.error[2].add(0)
+    ver_trace.error[0].add(1)
+    assert ver_trace.get_violations() == {(0, 1), (2, 0)}
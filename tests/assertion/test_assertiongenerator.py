@@ -4,9 +4,13 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+from unittest import mock
+from unittest.mock import MagicMock
+
 import pytest
 
 import pynguin.assertion.assertiongenerator as ag
+import pynguin.testcase.execution as ex
 
 
 @pytest.mark.parametrize(
@@ -32,3 +36,34 @@ def test_mutation_score(created, killed, timeout, score):
 )
 def test_compute_metrics(inp, result):
     assert ag._MutationSummary(inp).get_metrics() == result
+
+
+def test_mutant_execution_append():
+    execution = ag._MutantExecution()
+    killing = ex.ExecutionResult()
+    killing.assertion_verification_trace.failed[1].add(0)
+    execution.append(ex.ExecutionResult())
+    execution.append(killing)
+    execution.append(ex.ExecutionResult(timeout=True))
+    assert execution == ag._MutantExecution(
+        [False, False, True], [False, True, False], [set(), {(1, 0)}, set()]
+    )
+
+
+def test_mutant_execution_timed_out():
+    assert ag._MutantExecution.timed_out(2).timeouts == [True, True]
+
+
+def test_execute_on_identical_mutants_once():
+    generator = object.__new__(ag.MutationAnalysisAssertionGenerator)
+    generator._jobs = 1
+    generator._mutated_modules = [MagicMock(), MagicMock(), MagicMock()]
+    generator._mutant_origins = [0, 0, 2]
+    generator._mutation_executor = MagicMock()
+    generator._verification_observer = MagicMock()
+    first, third = ag._MutantExecution(), ag._MutantExecution()
+    with mock.patch.object(
+        generator, "_execute_on_mutant", side_effect=[first, third]
+    ) as execute:
+        assert generator._execute_on_mutants([]) == [first, first, third]
+    assert [call.args[0] for call in execute.call_args_list] == [0, 2]
@@ -9,6 +9,9 @@ import ast
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
+import pynguin.assertion.assertion as ass
 import pynguin.assertion.assertiontraceobserver as ato
 
 from pynguin.testcase.execution import ExecutionContext
@@ -50,3 +53,122 @@ def test_after_test_case_execution():
         trace_mock.clone.return_value = clone
         observer.after_test_case_execution_inside_thread(MagicMock(), result)
         assert result.assertion_trace == clone
+
+
+@pytest.mark.parametrize(
+    "assertion,value,holds",
+    [
+        (ass.FloatAssertion(MagicMock(), 2.5), 2.501, True),
+        (ass.FloatAssertion(MagicMock(), 2.5), 2.0, False),
+        (ass.CollectionLengthAssertion(MagicMock(), 2), [1, 2], True),
+        (ass.CollectionLengthAssertion(MagicMock(), 2), [1], False),
+        (ass.ObjectAssertion(MagicMock(), 42), 42, True),
+        (ass.ObjectAssertion(MagicMock(), "foo"), "bar", False),
+        (ass.ObjectAssertion(MagicMock(), True), True, True),  # noqa: FBT003
+        (ass.ObjectAssertion(MagicMock(), None), 0, False),
+        (ass.ObjectAssertion(MagicMock(), [1, 2]), [1, 2], None),
+        (ass.TypeNameAssertion(MagicMock(), "builtins", "int"), 42, None),
+    ],
+)
+def test_check_directly(assertion, value, holds):
+    exec_ctx = MagicMock(get_reference_value=MagicMock(return_value=value))
+    assert (
+        ato.AssertionVerificationObserver._check_directly(assertion, exec_ctx) == holds
+    )
+
+
+def test_check_assertion_failed_directly():
+    executor = MagicMock(instrument=False)
+    exec_ctx = MagicMock(get_reference_value=MagicMock(return_value=1))
+    exc = ato.AssertionVerificationObserver._check_assertion(
+        ass.ObjectAssertion(MagicMock(), 2), executor, exec_ctx
+    )
+    assert isinstance(exc, AssertionError)
+    executor.execute_ast.assert_not_called()
+
+
+def test_check_assertion_instrumented():
+    executor = MagicMock(instrument=True)
+    exec_ctx = MagicMock()
+    ato.AssertionVerificationObserver._check_assertion(
+        ass.ObjectAssertion(MagicMock(), 2), executor, exec_ctx
+    )
+    executor.execute_ast.assert_called_once()
+
+
+class _WithStaticField:
+    static_field = 42
+
+
+def test_handle_checks_static_fields_of_type_once():
+    observer = ato.AssertionTraceObserver()
+    observer._assertion_local_state.watch_list = [MagicMock(), MagicMock()]
+    statement = MagicMock()
+    statement.ret_val.is_none_type.return_value = True
+    exec_ctx = MagicMock(module_aliases=[])
+    exec_ctx.get_reference_value.side_effect = lambda _: _WithStaticField()
+    with mock.patch.object(observer, "_check_reference") as check_mock:
+        observer._handle(statement, exec_ctx)
+    # Once for each watched object and once for the shared static field.
+    assert check_mock.call_count == 3
+
+
+def test_handle_resolves_return_value_once():
+    observer = ato.AssertionTraceObserver()
+    statement = MagicMock()
+    statement.ret_val.is_none_type.return_value = False
+    exec_ctx = MagicMock(module_aliases=[])
+    exec_ctx.get_reference_value.return_value = [1, 2]
+    with mock.patch.object(observer, "_check_reference") as check_mock:
+        observer._handle(statement, exec_ctx)
+    exec_ctx.get_reference_value.assert_called_once_with(statement.ret_val)
+    check_mock.assert_not_called()
+
+
+def test_verification_uses_indexed_positions():
+    observer = ato.AssertionVerificationObserver()
+    statements = [MagicMock(), MagicMock()]
+    observer.before_test_case_execution(MagicMock(statements=statements))
+    statement = statements[1]
+    statement.has_only_exception_assertion.return_value = True
+    observer.after_statement_execution(
+        statement, MagicMock(), MagicMock(), ValueError()
+    )
+    assert observer.state.trace.get_violations() == {(1, 0)}
+    statement.get_position.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "first_value, violations",
+    [(2, {(0, 0), (0, 2)}), (1, {(0, 1), (0, 2)})],
+)
+def test_verification_skips_known_violations_once_violated(first_value, violations):
+    observer = ato.AssertionVerificationObserver()
+    statement = MagicMock()
+    statement.has_only_exception_assertion.return_value = False
+    statement.assertions = [
+        ass.ObjectAssertion(MagicMock(), first_value),
+        ass.ObjectAssertion(MagicMock(), 2),
+        ass.ObjectAssertion(MagicMock(), 2),
+    ]
+    observer.before_test_case_execution(MagicMock(statements=[statement]))
+    observer.set_known_violations({(0, 1)})
+    observer.after_statement_execution(
+        statement,
+        MagicMock(instrument=False),
+        MagicMock(get_reference_value=MagicMock(return_value=1)),
+        None,
+    )
+    assert observer.state.trace.get_violations() == violations
+
+
+@pytest.mark.parametrize(
+    "typ,names",
+    [
+        (int, ("builtins", "int")),
+        (_WithStaticField, (__name__, "_WithStaticField")),
+        (object(), None),
+    ],
+)
+def test_type_names(typ, names):
+    assert ato._type_names(typ) == names
@@ -146,6 +146,16 @@ def test_generic_field_hash(field_mock):
     assert hash(field_mock) == hash(field_mock)
 
 
+def test_generic_field_hash_equal_fields(field_mock, type_system):
+    same = GenericField(
+        field_mock.owner, field_mock.field, type_system.convert_type_hint(str)
+    )
+    other = GenericField(field_mock.owner, "other", type_system.convert_type_hint(str))
+    assert field_mock == same
+    assert hash(field_mock) == hash(same)
+    assert field_mock != other
+
+
 def test_generic_field_field(field_mock):
     assert field_mock.field == "y"
 
@@ -163,3 +173,10 @@ def test_generic_field_dependencies(field_mock, type_system):
 def test_generic_function_raised_exceptions():
     func = GenericFunction(MagicMock(), MagicMock(), {"FooError"})
     assert func.raised_exceptions == {"FooError"}
+
+
+def test_generic_accessible_objects_have_no_dict(
+    constructor_mock, method_mock, function_mock, field_mock
+):
+    for accessible in (constructor_mock, method_mock, function_mock, field_mock):
+        assert not hasattr(accessible, "__dict__")
@@ -0,0 +1,45 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2024 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import os
+
+import pytest
+
+from pynguin.utils import forking
+
+
+pytestmark = pytest.mark.skipif(not forking.can_fork(), reason="Requires fork")
+
+
+def _add(context: int, item: int) -> int:
+    if item == 3:
+        raise ValueError
+    if item == 5:
+        # Simulates a crash of the worker process, e.g., by a segmentation fault.
+        os._exit(1)
+    return context + item
+
+
+def _on_error(item: int, _error: Exception) -> int:
+    return -item
+
+
+@pytest.mark.parametrize(
+    "items, results",
+    [
+        ([1, 2, 4], [11, 12, 14]),
+        ([1, 3, 4], [11, -3, 14]),
+        ([1, 5, 4, 2], [11, -5, 14, 12]),
+        ([5, *range(6, 1000)], [-5, *range(16, 1010)]),
+    ],
+)
+def test_map_in_forked_processes(items, results):
+    assert forking.map_in_forked_processes(_add, 10, items, 2, _on_error) == results
+
+
+def test_map_in_forked_processes_resets_context():
+    forking.map_in_forked_processes(_add, 10, [1], 1, _on_error)
+    assert forking._CONTEXT is None
@@ -5,6 +5,7 @@
 #  SPDX-License-Identifier: MIT
 #
 import enum
+import fractions
 import inspect
 
 from unittest.mock import MagicMock
@@ -59,7 +60,14 @@ def test_is_none_type(type_, result):
 
 @pytest.mark.parametrize(
     "value, result",
-    [(5, True), (5.5, True), ("test", False), (None, False)],
+    [
+        (5, True),
+        (5.5, True),
+        (True, True),
+        (fractions.Fraction(1, 2), True),
+        ("test", False),
+        (None, False),
+    ],
 )
 def test_is_numeric(value, result):
     assert is_numeric(value) == result
@@ -235,6 +243,9 @@ def test_given_exception_matches(exception, ex_match, result):
         ([1, 1.5], False),
         (None, True),
         ([None], True),
+        (b"foo", True),
+        (True, True),
+        (1j, True),
     ],
 )
 def test_is_assertable(value, result):